@@ -5,6 +5,7 @@ Windows exe 배포용 단일 파일 구조
 
 import ast
 import operator
+from functools import lru_cache
 from typing import Union
 
 # 지원하는 연산자 매핑
@@ -21,45 +22,76 @@ OPERATORS = {
 }
 
 
-def safe_eval(node: ast.AST) -> Union[int, float]:
-    """AST 노드를 재귀적으로 평가"""
+def _eval_constant(node: ast.Constant) -> Union[int, float]:
+    """숫자 리터럴"""
+    if isinstance(node.value, (int, float)):
+        return node.value
+    raise ValueError(f"지원하지 않는 값: {node.value}")
+
+
+# 핸들러는 safe_eval을 거치지 않고 _DISPATCH로 자식 노드를 바로 평가
+# (AST 한 단계당 프레임 하나 → 재귀 깊이 한도 유지)
+# 지원하지 않는 노드는 KeyError로 올라가 safe_eval에서 ValueError로 변환
+
+def _eval_binop(node: ast.BinOp) -> Union[int, float]:
+    """이항 연산 (a + b, a * b 등)"""
+    left = node.left
+    left = _DISPATCH[type(left)](left)
+    right = node.right
+    right = _DISPATCH[type(right)](right)
+    op_type = type(node.op)
+    op_func = OPERATORS.get(op_type)
     
-    # 숫자 리터럴
-    if isinstance(node, ast.Constant):
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError(f"지원하지 않는 값: {node.value}")
+    if op_func is None:
+        raise ValueError(f"지원하지 않는 연산자: {op_type.__name__}")
     
-    # 이항 연산 (a + b, a * b 등)
-    if isinstance(node, ast.BinOp):
-        left = safe_eval(node.left)
-        right = safe_eval(node.right)
-        op_type = type(node.op)
-        
-        if op_type not in OPERATORS:
-            raise ValueError(f"지원하지 않는 연산자: {op_type.__name__}")
-        
-        # 0으로 나누기 체크
-        if op_type in (ast.Div, ast.FloorDiv, ast.Mod) and right == 0:
-            raise ZeroDivisionError("0으로 나눌 수 없습니다")
-        
-        return OPERATORS[op_type](left, right)
+    # 0으로 나누기 체크
+    if op_type in (ast.Div, ast.FloorDiv, ast.Mod) and right == 0:
+        raise ZeroDivisionError("0으로 나눌 수 없습니다")
     
-    # 단항 연산 (+a, -a)
-    if isinstance(node, ast.UnaryOp):
-        operand = safe_eval(node.operand)
-        op_type = type(node.op)
-        
-        if op_type not in OPERATORS:
-            raise ValueError(f"지원하지 않는 연산자: {op_type.__name__}")
-        
-        return OPERATORS[op_type](operand)
+    return op_func(left, right)
+
+
+def _eval_unaryop(node: ast.UnaryOp) -> Union[int, float]:
+    """단항 연산 (+a, -a)"""
+    operand = node.operand
+    operand = _DISPATCH[type(operand)](operand)
+    op_type = type(node.op)
+    op_func = OPERATORS.get(op_type)
     
-    # 괄호로 묶인 표현식
-    if isinstance(node, ast.Expression):
-        return safe_eval(node.body)
+    if op_func is None:
+        raise ValueError(f"지원하지 않는 연산자: {op_type.__name__}")
     
-    raise ValueError(f"지원하지 않는 구문: {type(node).__name__}")
+    return op_func(operand)
+
+
+# 노드 타입별 평가 함수 (isinstance 체인 대신 type() 한 번으로 분기)
+_DISPATCH = {
+    ast.Constant: _eval_constant,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unaryop,
+}
+
+
+def safe_eval(node: ast.AST) -> Union[int, float]:
+    """AST 노드를 재귀적으로 평가"""
+    # 괄호로 묶인 표현식 (최상위 Expression 노드)
+    if type(node) is ast.Expression:
+        node = node.body
+    
+    try:
+        return _DISPATCH[type(node)](node)
+    except KeyError as e:
+        raise ValueError(f"지원하지 않는 구문: {e.args[0].__name__}") from None
+
+
+@lru_cache(maxsize=256)
+def _parse(expression: str) -> ast.Expression:
+    """수식을 AST로 파싱 (같은 수식은 캐시된 트리 재사용)"""
+    try:
+        return ast.parse(expression, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"잘못된 수식: {e.msg}") from e
 
 
 def calculate(expression: str) -> Union[int, float]:
@@ -70,14 +102,8 @@ def calculate(expression: str) -> Union[int, float]:
     if not expression:
         raise ValueError("수식을 입력해주세요")
     
-    # AST로 파싱
-    try:
-        tree = ast.parse(expression, mode='eval')
-    except SyntaxError as e:
-        raise ValueError(f"잘못된 수식: {e.msg}")
-    
-    # 안전하게 평가
-    result = safe_eval(tree)
+    # AST로 파싱 후 안전하게 평가
+    result = safe_eval(_parse(expression))
     
     # 정수로 표현 가능하면 정수로
     if isinstance(result, float) and result.is_integer():